@@ -4,88 +4,339 @@ A simple web app with login, dashboard, and API endpoints
 Fixed: hashlib scrypt compatibility issue
 """
 
-from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify
-from werkzeug.security import generate_password_hash, check_password_hash
+from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify, g, has_app_context
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.security import check_password_hash
 import sqlite3
 import os
+import atexit
+import platform
+import queue
 import hashlib
+import hmac
 import secrets
+import threading
+import time
+from collections import OrderedDict
+import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 
-app = Flask(__name__)
+try:
+    import orjson
+except ImportError:
+    # Fallback to the standard library encoder
+    orjson = None
+
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import InvalidHashError, VerificationError
+except ImportError:
+    # Fallback to PBKDF2-only hashing
+    PasswordHasher = None
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster encoding"""
+    
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+        except TypeError:
+            # e.g. integers beyond 64 bits, which the stdlib encoder still handles
+            return super().dumps(obj, **kwargs)
+    
+    def loads(self, s, **kwargs):
+        # orjson has no object_hook, which the session serializer needs to untag values
+        if 'object_hook' in kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+class ORJSONFlask(Flask):
+    """Flask application that uses orjson for jsonify when it is available"""
+    json_provider_class = ORJSONProvider if orjson is not None else DefaultJSONProvider
+
+app = ORJSONFlask(__name__)
 app.secret_key = 'your-secret-key-change-in-production'
 app.config['DATABASE'] = 'test_app.db'
 
+PYTHON_VERSION = f"{os.sys.version_info.major}.{os.sys.version_info.minor}.{os.sys.version_info.micro}"
+
+# Host details never change while the process runs
+SYSTEM_INFO = {
+    'platform': platform.system(),
+    'python_version': platform.python_version(),
+    'flask_version': '3.0.0',
+    'hostname': platform.node()
+}
+
+# Batch hashing runs on a small thread pool; hashlib.pbkdf2_hmac releases the GIL
+_HASH_POOL_SIZE = min(4, os.cpu_count() or 1)
+_HASH_POOL = None
+_HASH_POOL_LOCK = threading.Lock()
+
+def _get_hash_pool():
+    """Create the password hashing thread pool on first use"""
+    global _HASH_POOL
+    with _HASH_POOL_LOCK:
+        if _HASH_POOL is None:
+            _HASH_POOL = ThreadPoolExecutor(max_workers=_HASH_POOL_SIZE,
+                                            thread_name_prefix='password-hash')
+            atexit.register(_HASH_POOL.shutdown, wait=False)
+        return _HASH_POOL
+
+_HMAC_TRANS_36 = bytes(x ^ 0x36 for x in range(256))
+_HMAC_TRANS_5C = bytes(x ^ 0x5C for x in range(256))
+
+def _pbkdf2_sha256_fast(password, salt, iterations):
+    """
+    Pure-Python PBKDF2-HMAC-SHA256 for builds without OpenSSL's pbkdf2_hmac
+    The HMAC ipad/opad states are absorbed once and copied every round
+    instead of re-hashing the padded key
+    """
+    if len(password) > 64:
+        password = hashlib.sha256(password).digest()
+    key = password.ljust(64, b'\0')
+    inner = hashlib.sha256(key.translate(_HMAC_TRANS_36))
+    outer = hashlib.sha256(key.translate(_HMAC_TRANS_5C))
+    
+    def prf(message):
+        inner_ctx = inner.copy()
+        inner_ctx.update(message)
+        outer_ctx = outer.copy()
+        outer_ctx.update(inner_ctx.digest())
+        return outer_ctx.digest()
+    
+    # A 32-byte key is a single block, so only block index 1 is needed
+    u = prf(salt + b'\x00\x00\x00\x01')
+    result = int.from_bytes(u, 'big')
+    for _ in range(iterations - 1):
+        u = prf(u)
+        result ^= int.from_bytes(u, 'big')
+    return result.to_bytes(32, 'big')
+
+# hashlib.pbkdf2_hmac only exists when Python is linked against OpenSSL
+if hasattr(hashlib, 'pbkdf2_hmac'):
+    _PBKDF2_SHA256 = functools.partial(hashlib.pbkdf2_hmac, 'sha256')
+else:
+    _PBKDF2_SHA256 = _pbkdf2_sha256_fast
+
+def _pbkdf2_sha256(password, salt, iterations):
+    """Compute PBKDF2-HMAC-SHA256 and return the raw digest"""
+    return _PBKDF2_SHA256(password.encode('utf-8'), salt.encode('utf-8'), iterations)
+
+# Argon2id is used for new hashes when argon2-cffi is installed
+ARGON2_HASHER = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=1) if PasswordHasher else None
+
+def hash_passwords(passwords):
+    """
+    Hash several passwords, returning the hashes in the same order as ``passwords``
+    Uses Argon2id when available, otherwise PBKDF2; either way across the hashing thread pool
+    """
+    if not passwords:
+        return []
+    pool = _get_hash_pool()
+    if ARGON2_HASHER is not None:
+        # argon2-cffi releases the GIL while hashing
+        return list(pool.map(ARGON2_HASHER.hash, passwords))
+    
+    salts = [secrets.token_hex(16) for _ in passwords]
+    # Submit everything first so the pool can work on all of them at once
+    futures = [pool.submit(_pbkdf2_sha256, password, salt, 100000)
+               for password, salt in zip(passwords, salts)]
+    return [f"pbkdf2:sha256:100000${salt}${future.result().hex()}"
+            for salt, future in zip(salts, futures)]
+
 def custom_password_hash(password):
     """
     Custom password hashing function for compatibility
-    Uses PBKDF2 which is more widely supported
+    Uses Argon2id when available, with PBKDF2 as the widely supported fallback
     """
-    salt = secrets.token_hex(16)
-    # Use PBKDF2 with SHA256 - widely supported
-    hash_obj = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), 100000)
-    return f"pbkdf2:sha256:100000${salt}${hash_obj.hex()}"
+    return hash_passwords([password])[0]
 
-def custom_check_password(password_hash, password):
+def password_needs_rehash(password_hash):
+    """Check whether a stored hash should be upgraded to the current Argon2id parameters"""
+    if ARGON2_HASHER is None:
+        return False
+    if not password_hash.startswith('$argon2'):
+        return True
+    try:
+        return ARGON2_HASHER.check_needs_rehash(password_hash)
+    except InvalidHashError:
+        return True
+
+# Bounded LRU of verification results, keyed on (stored hash, sha256(password))
+_VERIFY_CACHE = OrderedDict()
+_VERIFY_CACHE_MAXSIZE = 1024
+_VERIFY_CACHE_TTL = 300  # seconds
+_VERIFY_CACHE_LOCK = threading.Lock()
+
+def _verify_password(password_hash, password):
     """
-    Custom password verification function
+    Run the actual (expensive) password verification
+    Argon2 and PBKDF2-SHA256 hashes (Werkzeug or custom format) are checked
+    directly; anything else is handed to Werkzeug
     """
+    if password_hash.startswith('$argon2'):
+        if ARGON2_HASHER is None:
+            return False
+        try:
+            return ARGON2_HASHER.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    
     try:
-        method, salt, hash_value = password_hash.split('$')
-        hash_obj = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('utf-8'), 100000)
-        return hash_obj.hex() == hash_value
-    except:
-        # Fallback to Werkzeug if the hash format is different
+        method, salt, hash_value = password_hash.split('$', 2)
+    except ValueError:
+        return False
+    
+    if method.startswith('pbkdf2:sha256:'):
         try:
-            return check_password_hash(password_hash, password)
-        except:
+            iterations = int(method.rsplit(':', 1)[1])
+        except ValueError:
             return False
+        hash_obj = _pbkdf2_sha256(password, salt, iterations)
+        return hmac.compare_digest(hash_obj.hex(), hash_value)
+    
+    try:
+        return check_password_hash(password_hash, password)
+    except:
+        return False
 
-def init_db():
-    """Initialize the database with sample data"""
-    conn = sqlite3.connect(app.config['DATABASE'])
-    cursor = conn.cursor()
+def custom_check_password(password_hash, password):
+    """
+    Custom password verification function
+    Results are memoized for a few minutes; only a SHA-256 digest of the
+    password is used as the cache key, the plaintext is never stored
+    """
+    key = (password_hash, hashlib.sha256(password.encode('utf-8')).digest())
+    now = time.monotonic()
+    with _VERIFY_CACHE_LOCK:
+        cached = _VERIFY_CACHE.get(key)
+        if cached is not None and now - cached[1] < _VERIFY_CACHE_TTL:
+            _VERIFY_CACHE.move_to_end(key)
+            return cached[0]
     
-    # Create users table
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            email TEXT UNIQUE NOT NULL,
-            password_hash TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
+    result = _verify_password(password_hash, password)
     
-    # Create sample user if not exists
-    sample_users = [
-        ('admin', 'admin@example.com', 'admin123'),
-        ('testuser', 'test@example.com', 'password123'),
-        ('john_doe', 'john@example.com', 'john123')
-    ]
+    with _VERIFY_CACHE_LOCK:
+        _VERIFY_CACHE[key] = (result, now)
+        _VERIFY_CACHE.move_to_end(key)
+        while len(_VERIFY_CACHE) > _VERIFY_CACHE_MAXSIZE:
+            _VERIFY_CACHE.popitem(last=False)
+    return result
+
+# Pooled SQLite connections, reused across requests to keep the page cache warm
+_DB_POOL_SIZE = 5
+_DB_POOL = None
+_DB_POOL_LOCK = threading.Lock()
+
+def _create_connection():
+    """Open a SQLite connection tuned for concurrent web access"""
+    # The pool hands each connection to one thread at a time; pooled connections
+    # also keep sqlite3's prepared statement cache between requests
+    conn = sqlite3.connect(app.config['DATABASE'], check_same_thread=False)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA cache_size=-64000')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    return conn
+
+def _get_db_pool():
+    """Create the connection pool on first use"""
+    global _DB_POOL
+    with _DB_POOL_LOCK:
+        if _DB_POOL is None:
+            pool = queue.Queue(maxsize=_DB_POOL_SIZE)
+            for _ in range(_DB_POOL_SIZE):
+                pool.put(_create_connection())
+            _DB_POOL = pool
+        return _DB_POOL
+
+@contextmanager
+def get_conn():
+    """
+    Borrow a pooled database connection
+    Nested calls within the same request share one connection via flask.g
+    """
+    in_app = has_app_context()
+    if in_app and 'db_conn' in g:
+        yield g.db_conn
+        return
     
-    for username, email, password in sample_users:
-        cursor.execute('SELECT id FROM users WHERE username = ?', (username,))
-        if not cursor.fetchone():
-            try:
-                # Try Werkzeug first
-                password_hash = generate_password_hash(password, method='pbkdf2:sha256')
-            except Exception as e:
-                print(f"⚠️  Werkzeug hash failed, using custom hash for {username}: {e}")
-                # Fallback to custom hash
-                password_hash = custom_password_hash(password)
-            
-            cursor.execute('INSERT INTO users (username, email, password_hash) VALUES (?, ?, ?)',
-                         (username, email, password_hash))
+    pool = _get_db_pool()
+    conn = pool.get()
+    if in_app:
+        g.db_conn = conn
+    try:
+        yield conn
+    finally:
+        if in_app:
+            g.pop('db_conn', None)
+        if conn.in_transaction:
+            conn.rollback()
+        pool.put(conn)
+
+def init_db():
+    """Initialize the database with sample data"""
+    with get_conn() as conn:
+        cursor = conn.cursor()
+        
+        # Create users table
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS users (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                username TEXT UNIQUE NOT NULL,
+                email TEXT UNIQUE NOT NULL,
+                password_hash TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        # Redundant with the UNIQUE constraint, but keeps the login lookup's plan explicit
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_users_username ON users(username)')
+        
+        # Create sample user if not exists
+        sample_users = [
+            ('admin', 'admin@example.com', 'admin123'),
+            ('testuser', 'test@example.com', 'password123'),
+            ('john_doe', 'john@example.com', 'john123')
+        ]
+        
+        # One lookup for all sample users, so existing ones are not re-hashed
+        placeholders = ', '.join('?' for _ in sample_users)
+        cursor.execute(f'SELECT username FROM users WHERE username IN ({placeholders})',
+                       [username for username, _, _ in sample_users])
+        existing = {row[0] for row in cursor}
+        to_insert = [user for user in sample_users if user[0] not in existing]
+        
+        # Hash all missing users in parallel, then insert them in one transaction;
+        # the UNIQUE constraints make concurrent initialisation harmless
+        password_hashes = hash_passwords([password for _, _, password in to_insert])
+        conn.execute('BEGIN')
+        cursor.executemany('INSERT OR IGNORE INTO users (username, email, password_hash) VALUES (?, ?, ?)',
+                           [(username, email, password_hash)
+                            for (username, email, _), password_hash in zip(to_insert, password_hashes)])
+        for username, _, _ in to_insert:
             print(f"✅ Created user: {username}")
-    
-    conn.commit()
-    conn.close()
+        
+        conn.commit()
+        # Refresh planner statistics once; they are stored in the database file
+        conn.execute('ANALYZE')
+
+@app.before_request
+def load_session_user():
+    """Decode the session cookie once per request and expose the user on flask.g"""
+    g.user_id = session.get('user_id')
+    g.username = session.get('username')
 
 @app.route('/')
 def index():
     """Home page - redirects to login if not authenticated"""
-    if 'user_id' in session:
+    if g.user_id is not None:
         return redirect(url_for('dashboard'))
     return redirect(url_for('login'))
 
@@ -100,23 +351,23 @@ def login():
             flash('Please fill in all fields', 'error')
             return render_template('login.html')
         
-        conn = sqlite3.connect(app.config['DATABASE'])
-        cursor = conn.cursor()
-        cursor.execute('SELECT id, username, password_hash FROM users WHERE username = ?', (username,))
-        user = cursor.fetchone()
-        conn.close()
+        with get_conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT id, username, password_hash FROM users WHERE username = ?', (username,))
+            user = cursor.fetchone()
         
         if user:
-            # Try multiple password verification methods
-            password_valid = False
-            try:
-                # Try Werkzeug first
-                password_valid = check_password_hash(user[2], password)
-            except:
-                # Try custom verification
-                password_valid = custom_check_password(user[2], password)
+            # Tries Werkzeug and custom formats, cached across repeat logins
+            password_valid = custom_check_password(user[2], password)
             
             if password_valid:
+                if password_needs_rehash(user[2]):
+                    # Lazily migrate legacy PBKDF2 rows to Argon2id
+                    with get_conn() as conn:
+                        conn.execute('UPDATE users SET password_hash = ? WHERE id = ?',
+                                     (custom_password_hash(password), user[0]))
+                        conn.commit()
+                
                 session['user_id'] = user[0]
                 session['username'] = user[1]
                 flash('Login successful!', 'success')
@@ -131,31 +382,29 @@ def login():
 @app.route('/dashboard')
 def dashboard():
     """Dashboard page - requires authentication"""
-    if 'user_id' not in session:
+    if g.user_id is None:
         flash('Please log in to access the dashboard', 'error')
         return redirect(url_for('login'))
     
-    conn = sqlite3.connect(app.config['DATABASE'])
-    cursor = conn.cursor()
-    cursor.execute('SELECT COUNT(*) FROM users')
-    user_count = cursor.fetchone()[0]
-    conn.close()
+    with get_conn() as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT COUNT(*) FROM users')
+        user_count = cursor.fetchone()[0]
     
     return render_template('dashboard.html', 
-                         username=session.get('username'),
+                         username=g.username,
                          user_count=user_count)
 
 @app.route('/profile')
 def profile():
     """User profile page"""
-    if 'user_id' not in session:
+    if g.user_id is None:
         return redirect(url_for('login'))
     
-    conn = sqlite3.connect(app.config['DATABASE'])
-    cursor = conn.cursor()
-    cursor.execute('SELECT username, email, created_at FROM users WHERE id = ?', (session['user_id'],))
-    user = cursor.fetchone()
-    conn.close()
+    with get_conn() as conn:
+        cursor = conn.cursor()
+        cursor.execute('SELECT username, email, created_at FROM users WHERE id = ?', (g.user_id,))
+        user = cursor.fetchone()
     
     return render_template('profile.html', user=user)
 
@@ -166,235 +415,103 @@ def logout():
     flash('You have been logged out', 'info')
     return redirect(url_for('login'))
 
+# (second, formatted) pair; replaced as a whole so readers never see a torn value
+_TIMESTAMP_CACHE = (None, None)
+
+def iso_timestamp():
+    """Current local time in ISO-8601, formatted at most once per second"""
+    global _TIMESTAMP_CACHE
+    second = int(time.time())
+    cached_second, cached_value = _TIMESTAMP_CACHE
+    if cached_second != second:
+        cached_value = datetime.fromtimestamp(second).isoformat(timespec='seconds')
+        _TIMESTAMP_CACHE = (second, cached_value)
+    return cached_value
+
+def _dumps_json(obj):
+    """Serialize to compact JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _timestamped_json_parts(static_fields):
+    """
+    Pre-serialize a JSON object whose only changing field is a trailing timestamp
+    Returns (prefix, suffix) bytes; the response body is prefix + timestamp + suffix
+    """
+    body = _dumps_json({**static_fields, 'timestamp': ''})
+    # The encoded object ends with '"timestamp":""}'; split inside the empty string
+    return body[:-2], body[-2:]
+
+def _timestamped_json_response(parts, max_age=5):
+    """
+    Build a JSON response by splicing the current timestamp into pre-serialized parts
+    Clients may reuse the body for ``max_age`` seconds
+    """
+    prefix, suffix = parts
+    # ISO-8601 timestamps are plain ASCII and need no JSON escaping
+    response = app.response_class(prefix + iso_timestamp().encode('ascii') + suffix,
+                                  mimetype='application/json')
+    response.cache_control.max_age = max_age
+    return response
+
+_HEALTH_JSON = _timestamped_json_parts({
+    'status': 'healthy',
+    'version': '1.0.0',
+    'python_version': PYTHON_VERSION
+})
+_SYSTEM_INFO_JSON = _timestamped_json_parts(SYSTEM_INFO)
+
 # API Endpoints for testing
 @app.route('/api/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'version': '1.0.0',
-        'python_version': f"{os.sys.version_info.major}.{os.sys.version_info.minor}.{os.sys.version_info.micro}"
-    })
+    return _timestamped_json_response(_HEALTH_JSON)
 
 @app.route('/api/db/status')
 def db_status():
     """Database connectivity check"""
     try:
-        conn = sqlite3.connect(app.config['DATABASE'])
-        cursor = conn.cursor()
-        cursor.execute('SELECT COUNT(*) FROM users')
-        count = cursor.fetchone()[0]
-        conn.close()
+        with get_conn() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT COUNT(*) FROM users')
+            count = cursor.fetchone()[0]
         
         return jsonify({
             'status': 'connected',
             'user_count': count,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': iso_timestamp()
         })
     except Exception as e:
         return jsonify({
             'status': 'error',
             'error': str(e),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': iso_timestamp()
         }), 500
 
 @app.route('/api/users')
 def api_users():
     """API endpoint to get users (requires authentication)"""
-    if 'user_id' not in session:
+    if g.user_id is None:
         return jsonify({'error': 'Authentication required'}), 401
     
-    conn = sqlite3.connect(app.config['DATABASE'])
-    cursor = conn.cursor()
-    cursor.execute('SELECT id, username, email, created_at FROM users')
-    users = cursor.fetchall()
-    conn.close()
+    with get_conn() as conn:
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        cursor.execute('SELECT id, username, email, created_at FROM users')
+        users = [dict(user) for user in cursor]
     
-    return jsonify({
-        'users': [
-            {
-                'id': user[0],
-                'username': user[1],
-                'email': user[2],
-                'created_at': user[3]
-            } for user in users
-        ]
-    })
+    return jsonify({'users': users})
 
 @app.route('/api/system/info')
 def system_info():
     """System information endpoint"""
-    import platform
-    return jsonify({
-        'platform': platform.system(),
-        'python_version': platform.python_version(),
-        'flask_version': '3.0.0',
-        'hostname': platform.node(),
-        'timestamp': datetime.now().isoformat()
-    })
-
-def create_templates():
-    """Create template files"""
-    # Ensure templates directory exists
-    os.makedirs('templates', exist_ok=True)
-    
-    templates = {
-        'base.html': '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{% block title %}Test Application{% endblock %}</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }
-        .container { max-width: 800px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-        .header { background-color: #007bff; color: white; padding: 10px 20px; margin: -20px -20px 20px -20px; border-radius: 8px 8px 0 0; }
-        .nav { margin-bottom: 20px; }
-        .nav a { color: #007bff; text-decoration: none; margin-right: 15px; }
-        .nav a:hover { text-decoration: underline; }
-        .form-group { margin-bottom: 15px; }
-        .form-group label { display: block; margin-bottom: 5px; font-weight: bold; }
-        .form-group input { width: 100%; padding: 8px; border: 1px solid #ddd; border-radius: 4px; box-sizing: border-box; }
-        .btn { background-color: #007bff; color: white; padding: 10px 20px; border: none; border-radius: 4px; cursor: pointer; }
-        .btn:hover { background-color: #0056b3; }
-        .alert { padding: 10px; margin-bottom: 15px; border-radius: 4px; }
-        .alert-success { background-color: #d4edda; color: #155724; border: 1px solid #c3e6cb; }
-        .alert-error { background-color: #f8d7da; color: #721c24; border: 1px solid #f5c6cb; }
-        .alert-info { background-color: #d1ecf1; color: #0c5460; border: 1px solid #bee5eb; }
-        .card { border: 1px solid #ddd; border-radius: 4px; padding: 15px; margin-bottom: 15px; }
-        .card h3 { margin-top: 0; }
-        .status-badge { display: inline-block; padding: 2px 8px; border-radius: 12px; font-size: 12px; font-weight: bold; }
-        .status-success { background-color: #28a745; color: white; }
-        .status-error { background-color: #dc3545; color: white; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>{% block header %}Test Application{% endblock %}</h1>
-            <span class="status-badge status-success">✅ Fixed Version</span>
-        </div>
-        
-        {% if session.user_id %}
-        <div class="nav">
-            <a href="{{ url_for('dashboard') }}">Dashboard</a>
-            <a href="{{ url_for('profile') }}">Profile</a>
-            <a href="{{ url_for('logout') }}">Logout</a>
-            <span style="float: right;">Welcome, {{ session.username }}!</span>
-        </div>
-        {% endif %}
-        
-        {% with messages = get_flashed_messages(with_categories=true) %}
-            {% if messages %}
-                {% for category, message in messages %}
-                    <div class="alert alert-{{ category }}">{{ message }}</div>
-                {% endfor %}
-            {% endif %}
-        {% endwith %}
-        
-        {% block content %}{% endblock %}
-    </div>
-</body>
-</html>''',
-        
-        'login.html': '''{% extends "base.html" %}
-{% block title %}Login - Test Application{% endblock %}
-{% block header %}Login{% endblock %}
-{% block content %}
-<div class="card">
-    <h3>Please Login</h3>
-    <form method="POST" id="login-form">
-        <div class="form-group">
-            <label for="username">Username:</label>
-            <input type="text" id="username" name="username" required>
-        </div>
-        <div class="form-group">
-            <label for="password">Password:</label>
-            <input type="password" id="password" name="password" required>
-        </div>
-        <button type="submit" class="btn" id="login-btn">Login</button>
-    </form>
-    
-    <div style="margin-top: 20px; padding: 10px; background-color: #f8f9fa; border-radius: 4px;">
-        <h4>✅ Test Accounts (Fixed Version):</h4>
-        <p><strong>admin</strong> / admin123</p>
-        <p><strong>testuser</strong> / password123</p>
-        <p><strong>john_doe</strong> / john123</p>
-    </div>
-</div>
-{% endblock %}''',
-        
-        'dashboard.html': '''{% extends "base.html" %}
-{% block title %}Dashboard - Test Application{% endblock %}
-{% block header %}Dashboard{% endblock %}
-{% block content %}
-<div class="card">
-    <h3>Welcome to your Dashboard, {{ username }}!</h3>
-    <p>You have successfully logged in to the test application.</p>
-    <span class="status-badge status-success">✅ Authentication Working</span>
-</div>
-
-<div class="card">
-    <h3>System Statistics</h3>
-    <p id="user-count"><strong>Total Users:</strong> {{ user_count }}</p>
-    <p><strong>Your Role:</strong> User</p>
-    <p><strong>Last Login:</strong> Just now</p>
-    <p><strong>Status:</strong> <span class="status-badge status-success">Active</span></p>
-</div>
-
-<div class="card">
-    <h3>Quick Actions</h3>
-    <a href="{{ url_for('profile') }}" class="btn">View Profile</a>
-    <a href="{{ url_for('logout') }}" class="btn" style="background-color: #dc3545;">Logout</a>
-</div>
-
-<div class="card">
-    <h3>API Endpoints</h3>
-    <p><a href="/api/health" target="_blank">Health Check</a></p>
-    <p><a href="/api/db/status" target="_blank">Database Status</a></p>
-    <p><a href="/api/system/info" target="_blank">System Info</a></p>
-</div>
-{% endblock %}''',
-        
-        'profile.html': '''{% extends "base.html" %}
-{% block title %}Profile - Test Application{% endblock %}
-{% block header %}User Profile{% endblock %}
-{% block content %}
-<div class="card">
-    <h3>Your Profile Information</h3>
-    {% if user %}
-    <p><strong>Username:</strong> {{ user[0] }}</p>
-    <p><strong>Email:</strong> {{ user[1] }}</p>
-    <p><strong>Member Since:</strong> {{ user[2] }}</p>
-    <p><strong>Status:</strong> <span class="status-badge status-success">Active</span></p>
-    {% endif %}
-</div>
-
-<div class="card">
-    <h3>Account Actions</h3>
-    <a href="{{ url_for('dashboard') }}" class="btn">Back to Dashboard</a>
-</div>
-{% endblock %}'''
-    }
-    
-    for filename, content in templates.items():
-        filepath = os.path.join('templates', filename)
-        try:
-            with open(filepath, 'w') as f:
-                f.write(content)
-            print(f"✅ Created template: {filename}")
-        except Exception as e:
-            print(f"❌ Failed to create {filename}: {e}")
+    return _timestamped_json_response(_SYSTEM_INFO_JSON)
 
 if __name__ == '__main__':
     print("🔧 Flask Application Setup (Fixed Version)")
     print("=" * 50)
     
-    # Create templates
-    print("📁 Creating templates...")
-    create_templates()
-    
     # Initialize database
     print("🗄️  Initializing database...")
     try:
@@ -417,7 +534,23 @@ if __name__ == '__main__':
     print("   👥 http://localhost:5000/api/users")
     print("   💻 http://localhost:5000/api/system/info")
     print("\n🐛 Issue Fixed: hashlib.scrypt compatibility")
-    print("💡 Using PBKDF2-SHA256 for password hashing")
+    if ARGON2_HASHER is not None:
+        print("💡 Using Argon2id for password hashing (legacy PBKDF2-SHA256 hashes upgraded on login)")
+    else:
+        print("💡 Using PBKDF2-SHA256 for password hashing (install argon2-cffi for Argon2id)")
     print("=" * 50)
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    if os.getenv('FLASK_DEV'):
+        # Werkzeug dev server with debugger and reloader
+        app.run(debug=True, host='0.0.0.0', port=5000)
+    else:
+        # Production server: one gunicorn worker per core, threaded
+        # --chdir lets gunicorn import app:app however this script was launched
+        gunicorn_cmd = ['gunicorn', '-w', str(os.cpu_count() or 1), '-k', 'gthread', '--threads', '8',
+                        '--chdir', os.path.dirname(os.path.abspath(__file__)),
+                        '-b', '0.0.0.0:5000', 'app:app']
+        try:
+            os.execvp(gunicorn_cmd[0], gunicorn_cmd)
+        except OSError as e:
+            print(f"⚠️  Could not start gunicorn ({e}), falling back to the threaded dev server")
+            app.run(host='0.0.0.0', port=5000, threaded=True)
\ No newline at end of file
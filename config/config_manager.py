@@ -6,7 +6,9 @@ for the test automation framework, following SOLID principles.
 """
 
 import os
+import re
 import json
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 from pathlib import Path
@@ -43,6 +45,12 @@ class ConfigManager:
     following the Single Responsibility Principle.
     """
     
+    # KEY=value lines; comments and blank lines never match
+    _ENV_LINE_PATTERN = re.compile(r'^[ \t]*([^#=\s][^=\n]*?)[ \t]*=(.*)$', re.MULTILINE)
+    
+    # Parsed .env files keyed by path, shared across instances
+    _env_file_cache: Dict[str, Dict[str, str]] = {}
+    
     def __init__(self):
         self.project_root = Path(__file__).parent.parent
         self._load_environment_variables()
@@ -52,13 +60,17 @@ class ConfigManager:
     def _load_environment_variables(self):
         """Load environment variables from .env file if present"""
         env_file = self.project_root / '.env'
-        if env_file.exists():
-            with open(env_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#') and '=' in line:
-                        key, value = line.split('=', 1)
-                        os.environ.setdefault(key.strip(), value.strip())
+        cache_key = str(env_file)
+        
+        if cache_key not in self._env_file_cache:
+            values = {}
+            if env_file.exists():
+                text = env_file.read_text()
+                values = {key: value.strip() for key, value in self._ENV_LINE_PATTERN.findall(text)}
+            self._env_file_cache[cache_key] = values
+        
+        for key, value in self._env_file_cache[cache_key].items():
+            os.environ.setdefault(key, value)
     
     def _setup_environments(self):
         """Setup environment configurations"""
@@ -88,46 +100,43 @@ class ConfigManager:
     
     def _setup_browser_configs(self):
         """Setup browser configurations"""
+        # Read the shared browser settings once and reuse them for every browser
+        headless = os.getenv('HEADLESS', 'false').lower() == 'true'
+        window_size = (
+            int(os.getenv('WINDOW_WIDTH', '1920')),
+            int(os.getenv('WINDOW_HEIGHT', '1080'))
+        )
+        implicit_wait = int(os.getenv('IMPLICIT_WAIT', '10'))
+        page_load_timeout = int(os.getenv('PAGE_LOAD_TIMEOUT', '30'))
+        
         self.browser_configs = {
             'chrome': BrowserConfig(
                 name='chrome',
-                headless=os.getenv('HEADLESS', 'false').lower() == 'true',
-                window_size=(
-                    int(os.getenv('WINDOW_WIDTH', '1920')),
-                    int(os.getenv('WINDOW_HEIGHT', '1080'))
-                ),
-                implicit_wait=int(os.getenv('IMPLICIT_WAIT', '10')),
-                page_load_timeout=int(os.getenv('PAGE_LOAD_TIMEOUT', '30'))
+                headless=headless,
+                window_size=window_size,
+                implicit_wait=implicit_wait,
+                page_load_timeout=page_load_timeout
             ),
             'firefox': BrowserConfig(
                 name='firefox',
-                headless=os.getenv('HEADLESS', 'false').lower() == 'true',
-                window_size=(
-                    int(os.getenv('WINDOW_WIDTH', '1920')),
-                    int(os.getenv('WINDOW_HEIGHT', '1080'))
-                ),
-                implicit_wait=int(os.getenv('IMPLICIT_WAIT', '10')),
-                page_load_timeout=int(os.getenv('PAGE_LOAD_TIMEOUT', '30'))
+                headless=headless,
+                window_size=window_size,
+                implicit_wait=implicit_wait,
+                page_load_timeout=page_load_timeout
             ),
             'edge': BrowserConfig(
                 name='edge',
-                headless=os.getenv('HEADLESS', 'false').lower() == 'true',
-                window_size=(
-                    int(os.getenv('WINDOW_WIDTH', '1920')),
-                    int(os.getenv('WINDOW_HEIGHT', '1080'))
-                ),
-                implicit_wait=int(os.getenv('IMPLICIT_WAIT', '10')),
-                page_load_timeout=int(os.getenv('PAGE_LOAD_TIMEOUT', '30'))
+                headless=headless,
+                window_size=window_size,
+                implicit_wait=implicit_wait,
+                page_load_timeout=page_load_timeout
             ),
             'headless': BrowserConfig(
                 name='chrome',
                 headless=True,
-                window_size=(
-                    int(os.getenv('WINDOW_WIDTH', '1920')),
-                    int(os.getenv('WINDOW_HEIGHT', '1080'))
-                ),
-                implicit_wait=int(os.getenv('IMPLICIT_WAIT', '10')),
-                page_load_timeout=int(os.getenv('PAGE_LOAD_TIMEOUT', '30'))
+                window_size=window_size,
+                implicit_wait=implicit_wait,
+                page_load_timeout=page_load_timeout
             )
         }
     
@@ -198,7 +207,17 @@ class ConfigManager:
         return test_data_dir
     
     def create_directories(self):
-        """Create all necessary directories"""
+        """
+        Create all necessary directories.
+        
+        A marker file is written after the first successful run so later
+        imports skip the directory setup entirely. Delete the marker to
+        force the tree to be recreated.
+        """
+        marker = self.project_root / '.bootstrapped'
+        if marker.exists():
+            return
+        
         directories = [
             'reports/html',
             'reports/json', 
@@ -222,6 +241,12 @@ class ConfigManager:
                 init_file = dir_path / '__init__.py'
                 if not init_file.exists():
                     init_file.touch()
+        
+        try:
+            marker.touch()
+        except OSError:
+            # Read-only checkout; the directories exist, so just re-check next time
+            pass
     
     def get_database_config(self, env_name: str = None) -> Dict[str, Any]:
         """
@@ -328,8 +353,14 @@ class ConfigManager:
             return False
 
 
+@lru_cache(maxsize=None)
+def _config_singleton() -> ConfigManager:
+    """Create the process-wide ConfigManager on first use"""
+    return ConfigManager()
+
+
 # Global configuration instance
-config_manager = ConfigManager()
+config_manager = _config_singleton()
 
 
 def get_config() -> ConfigManager:
@@ -339,7 +370,7 @@ def get_config() -> ConfigManager:
     Returns:
         ConfigManager instance
     """
-    return config_manager
+    return _config_singleton()
 
 
 # Convenience functions for quick access
@@ -6,20 +6,24 @@ across all test modules in the project.
 """
 
 import os
+import sys
+import time
 import pytest
 import logging
+import queue
+import shutil
+import tempfile
+import threading
+import subprocess
+import urllib.error
+import urllib.request
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
+from urllib.parse import urlparse
+
+# Selenium is imported inside the driver fixture so API-only runs
+# (e.g. ``-m api``) never load it
 
 # Import our configuration manager
 try:
@@ -49,17 +53,50 @@ except ImportError:
         def get_logs_dir(self):
             return Path("reports/logs")
     
+    @lru_cache(maxsize=None)
     def get_config():
         return ConfigManager()
 
 
+PROJECT_ROOT = Path(__file__).parent
+
+# Chrome flags shared by every session; the last group trims idle background work
+_CHROME_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-infobars",
+    "--disable-notifications",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--no-first-run",
+    "--disable-backgrounding-occluded-windows",
+)
+
+# Flask server started for this test run, if one was not already running,
+# and the URL it serves on (shared with xdist workers)
+_app_server = None
+_app_server_url = None
+
+# Failure screenshots are written to disk by a background thread
+_screenshot_queue = queue.Queue()
+_screenshot_writer = None
+
+
+def _xdist_worker():
+    """Name of the current pytest-xdist worker (gw0 when not distributed)"""
+    return os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+
+
 def pytest_addoption(parser):
     """Add custom command line options for pytest"""
     parser.addoption(
         "--browser",
         action="store",
         default="chrome",
-        help="Browser to run tests on: chrome, firefox, edge, headless"
+        help="Browser(s) to run tests on: chrome, firefox, edge, headless (comma-separated for cross-browser runs)"
     )
     parser.addoption(
         "--env",
@@ -85,6 +122,109 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "integration: mark test as integration test")
     config.addinivalue_line("markers", "slow: mark test as slow running")
     
+    # Each xdist worker would truncate the shared log_file; give workers their own
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    log_file = config.getoption("log_file") or config.getini("log_file")
+    if worker and log_file:
+        log_path = Path(log_file)
+        config.option.log_file = str(log_path.with_name(f"{log_path.stem}_{worker}{log_path.suffix}"))
+
+
+def _is_server_up(url, timeout=1.0):
+    """Check whether anything answers HTTP at the given URL"""
+    try:
+        urllib.request.urlopen(url, timeout=timeout)
+        return True
+    except urllib.error.HTTPError:
+        # The server responded, just not with a 2xx
+        return True
+    except (urllib.error.URLError, OSError):
+        return False
+
+
+def _start_app_server(config, startup_timeout=30):
+    """Start the Flask app for local runs unless it is already running"""
+    global _app_server, _app_server_url
+    base_url = get_config().get_environment_config(config.getoption("--env")).base_url
+    parsed = urlparse(base_url)
+    if parsed.hostname not in ("localhost", "127.0.0.1") or _is_server_up(base_url):
+        return
+    
+    env = dict(os.environ, PORT=str(parsed.port or 80))
+    _app_server = subprocess.Popen([sys.executable, "run_app.py"], cwd=PROJECT_ROOT, env=env)
+    
+    deadline = time.monotonic() + startup_timeout
+    while time.monotonic() < deadline:
+        if _app_server.poll() is not None:
+            pytest.exit(f"Flask server exited with code {_app_server.returncode}", returncode=3)
+        if _is_server_up(base_url):
+            logging.info(f"Started Flask server at {base_url}")
+            _app_server_url = base_url
+            return
+        time.sleep(0.2)
+    
+    _stop_app_server()
+    pytest.exit(f"Flask server did not start at {base_url} within {startup_timeout}s", returncode=3)
+
+
+def _stop_app_server():
+    """Stop the Flask server started by this test run"""
+    global _app_server, _app_server_url
+    _app_server_url = None
+    if _app_server is None:
+        return
+    _app_server.terminate()
+    try:
+        _app_server.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        _app_server.kill()
+    _app_server = None
+
+
+def _write_screenshots():
+    """Drain the screenshot queue until the None sentinel arrives"""
+    while True:
+        item = _screenshot_queue.get()
+        if item is None:
+            return
+        path, png = item
+        try:
+            Path(path).write_bytes(png)
+            logging.info(f"Screenshot saved: {path}")
+        except OSError as e:
+            logging.error(f"Failed to save screenshot {path}: {e}")
+
+
+def _start_screenshot_writer():
+    """Start the background screenshot writer for this process"""
+    global _screenshot_writer
+    _screenshot_writer = threading.Thread(target=_write_screenshots, name="screenshot-writer", daemon=True)
+    _screenshot_writer.start()
+
+
+def _stop_screenshot_writer():
+    """Flush pending screenshots and stop the writer thread"""
+    global _screenshot_writer
+    if _screenshot_writer is None:
+        return
+    _screenshot_queue.put(None)
+    _screenshot_writer.join()
+    _screenshot_writer = None
+
+
+def pytest_sessionstart(session):
+    """
+    One-shot setup for the whole test run.
+    
+    Every process (including xdist workers) gets its own screenshot writer;
+    the rest runs only in the main process (the xdist controller, or a
+    plain run), so worker processes don't repeat it.
+    """
+    _start_screenshot_writer()
+    
+    if hasattr(session.config, "workerinput"):
+        return
+    
     # Create reports directory
     reports_dir = Path("reports")
     reports_dir.mkdir(exist_ok=True)
@@ -92,6 +232,26 @@ def pytest_configure(config):
     (reports_dir / "logs").mkdir(exist_ok=True)
     (reports_dir / "html").mkdir(exist_ok=True)
     (reports_dir / "json").mkdir(exist_ok=True)
+    
+    # Collecting tests never talks to the app, so don't boot it
+    if not session.config.option.collectonly:
+        _start_app_server(session.config)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Share the controller's Flask server with each xdist worker"""
+    if _app_server_url:
+        node.workerinput["base_url"] = _app_server_url
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Tear down anything started in pytest_sessionstart"""
+    _stop_screenshot_writer()
+    
+    if hasattr(session.config, "workerinput"):
+        return
+    _stop_app_server()
 
 
 @pytest.fixture(scope="session")
@@ -107,76 +267,135 @@ def environment(request):
     return env_name
 
 
+def _requested_browsers(config):
+    """Browsers listed in --browser"""
+    return [name.strip() for name in config.getoption("--browser").split(",") if name.strip()]
+
+
+def pytest_generate_tests(metafunc):
+    """
+    Parametrize browser tests when several browsers are requested.
+    
+    The parameter is session-scoped, so pytest groups tests by browser and
+    each worker keeps one driver per browser for the whole run.
+    """
+    if "browser_name" not in metafunc.fixturenames:
+        return
+    browsers = _requested_browsers(metafunc.config)
+    if len(browsers) > 1:
+        metafunc.parametrize("browser_name", browsers, indirect=True, scope="session", ids=browsers)
+
+
 @pytest.fixture(scope="session")
 def browser_name(request):
     """Browser name fixture"""
-    browser = request.config.getoption("--browser")
-    headless = request.config.getoption("--headless")
-    
-    if headless and browser != "headless":
-        return "headless"
-    return browser
+    return getattr(request, "param", None) or _requested_browsers(request.config)[0]
 
 
 @pytest.fixture(scope="session")
-def base_url(config, environment):
+def base_url(request, config, environment):
     """Base URL fixture for the test environment"""
+    # Prefer the server started by the controller for this run
+    workerinput = getattr(request.config, "workerinput", {})
+    if "base_url" in workerinput:
+        return workerinput["base_url"]
+    if _app_server_url:
+        return _app_server_url
+    
     env_config = config.get_environment_config(environment)
     return env_config.base_url
 
 
-@pytest.fixture(scope="function")
-def driver(request, config, browser_name):
+# Driver binaries are located by Selenium Manager (cached under ~/.cache/selenium).
+# These fixtures let air-gapped CI point at preinstalled drivers instead.
+@pytest.fixture(scope="session")
+def chrome_driver_path():
+    """ChromeDriver path from $CHROMEDRIVER, or None to let Selenium Manager resolve it"""
+    return os.environ.get("CHROMEDRIVER")
+
+
+@pytest.fixture(scope="session")
+def firefox_driver_path():
+    """GeckoDriver path from $GECKODRIVER, or None to let Selenium Manager resolve it"""
+    return os.environ.get("GECKODRIVER")
+
+
+@pytest.fixture(scope="session")
+def edge_driver_path():
+    """EdgeDriver path from $EDGEDRIVER, or None to let Selenium Manager resolve it"""
+    return os.environ.get("EDGEDRIVER")
+
+
+def _headless_requested(request, browser_config, browser_name):
+    """Whether this browser runs headless; --headless applies to every requested browser"""
+    return browser_config.headless or browser_name == "headless" or request.config.getoption("--headless")
+
+
+@pytest.fixture(scope="session")
+def _driver_session(request, config, browser_name):
     """
-    WebDriver fixture that provides browser instances for tests.
+    Session-scoped WebDriver instance shared by all tests.
     
     This fixture:
     - Creates a WebDriver instance based on the browser parameter
     - Configures the browser with appropriate options
-    - Handles cleanup after test completion
-    - Captures screenshots on test failure
+    - Quits the browser once at the end of the test session
     """
+    from selenium import webdriver
+    
     browser_config = config.get_browser_config(browser_name)
     driver_instance = None
+    profile_dir = None
+    
+    is_chrome = browser_config.name == "chrome" or browser_name == "headless"
+    headless = _headless_requested(request, browser_config, browser_name)
     
     try:
-        if browser_config.name == "chrome" or browser_name == "headless":
+        if is_chrome:
+            from selenium.webdriver.chrome.options import Options as ChromeOptions
+            from selenium.webdriver.chrome.service import Service as ChromeService
+            
             options = ChromeOptions()
             
             # Chrome-specific options
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-gpu")
-            options.add_argument("--disable-extensions")
-            options.add_argument("--disable-infobars")
-            options.add_argument("--disable-notifications")
+            for argument in _CHROME_ARGS:
+                options.add_argument(argument)
             options.add_argument(f"--window-size={browser_config.window_size[0]},{browser_config.window_size[1]}")
+            # Fresh profile per session and worker to avoid SingletonLock conflicts
+            profile_dir = tempfile.mkdtemp(prefix=f"chrome-{_xdist_worker()}-")
+            options.add_argument(f"--user-data-dir={profile_dir}")
             
-            if browser_config.headless or browser_name == "headless":
+            if headless:
                 options.add_argument("--headless")
             
             # Create Chrome driver
-            service = ChromeService(ChromeDriverManager().install())
+            service = ChromeService(executable_path=request.getfixturevalue("chrome_driver_path"))
             driver_instance = webdriver.Chrome(service=service, options=options)
             
         elif browser_config.name == "firefox":
+            from selenium.webdriver.firefox.options import Options as FirefoxOptions
+            from selenium.webdriver.firefox.service import Service as FirefoxService
+            
             options = FirefoxOptions()
             
-            if browser_config.headless:
+            if headless:
                 options.add_argument("--headless")
             
             # Create Firefox driver
-            service = FirefoxService(GeckoDriverManager().install())
+            service = FirefoxService(executable_path=request.getfixturevalue("firefox_driver_path"))
             driver_instance = webdriver.Firefox(service=service, options=options)
             
         elif browser_config.name == "edge":
+            from selenium.webdriver.edge.options import Options as EdgeOptions
+            from selenium.webdriver.edge.service import Service as EdgeService
+            
             options = EdgeOptions()
             
-            if browser_config.headless:
+            if headless:
                 options.add_argument("--headless")
             
             # Create Edge driver
-            service = EdgeService(EdgeChromiumDriverManager().install())
+            service = EdgeService(executable_path=request.getfixturevalue("edge_driver_path"))
             driver_instance = webdriver.Edge(service=service, options=options)
             
         else:
@@ -186,10 +405,11 @@ def driver(request, config, browser_name):
         driver_instance.implicitly_wait(browser_config.implicit_wait)
         driver_instance.set_page_load_timeout(browser_config.page_load_timeout)
         
-        # Maximize window if not headless
-        if not browser_config.headless and browser_name != "headless":
+        # Size the window once for the whole session. Chrome already starts
+        # at the right size from --window-size, so skip the extra round-trip
+        if not headless:
             driver_instance.maximize_window()
-        else:
+        elif not is_chrome:
             driver_instance.set_window_size(*browser_config.window_size)
         
         yield driver_instance
@@ -201,11 +421,101 @@ def driver(request, config, browser_name):
     finally:
         # Cleanup
         if driver_instance:
-            # Take screenshot on test failure
-            if request.node.rep_call.failed if hasattr(request.node, 'rep_call') else False:
-                take_screenshot(driver_instance, request.node.name, config)
-            
             driver_instance.quit()
+        if profile_dir:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+def _open_isolated_tab(driver_instance, window_size, maximize=False):
+    """
+    Open a tab in a fresh browser context via the Chrome DevTools Protocol.
+    
+    The new context has its own cookies, storage and cache, so tests are
+    isolated without relaunching the browser. The tab's window gets the
+    session's sizing: ``window_size``, or maximized for headed runs.
+    
+    Returns:
+        (browser_context_id, original_window_handle), or None when the
+        browser does not support CDP
+    """
+    if not hasattr(driver_instance, "execute_cdp_cmd"):
+        return None
+    
+    context_id = None
+    try:
+        original_handle = driver_instance.current_window_handle
+        existing_handles = set(driver_instance.window_handles)
+        context_id = driver_instance.execute_cdp_cmd("Target.createBrowserContext", {})["browserContextId"]
+        # width/height only apply to a new window in headed Chrome
+        driver_instance.execute_cdp_cmd("Target.createTarget", {
+            "url": "about:blank",
+            "browserContextId": context_id,
+            "newWindow": True,
+            "width": window_size[0],
+            "height": window_size[1]
+        })
+        new_handle = next(h for h in driver_instance.window_handles if h not in existing_handles)
+        driver_instance.switch_to.window(new_handle)
+        if maximize:
+            driver_instance.maximize_window()
+        return context_id, original_handle
+    except Exception as e:
+        logging.warning(f"Could not open isolated browser context: {e}")
+        if context_id is not None:
+            # Don't leak a half-opened context into the shared browser;
+            # disposing it also closes any tab created inside it
+            try:
+                driver_instance.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+                driver_instance.switch_to.window(original_handle)
+            except Exception as cleanup_error:
+                logging.warning(f"Failed to dispose browser context: {cleanup_error}")
+        return None
+
+
+def _close_isolated_tab(driver_instance, isolated):
+    """Close the tab opened by _open_isolated_tab and dispose of its context"""
+    context_id, original_handle = isolated
+    driver_instance.close()
+    driver_instance.switch_to.window(original_handle)
+    driver_instance.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+
+
+@pytest.fixture(scope="function")
+def driver(request, config, browser_name, _driver_session):
+    """
+    WebDriver fixture that provides browser instances for tests.
+    
+    This fixture:
+    - Hands out the shared session-scoped browser
+    - Runs each test in its own browser context where CDP is available
+    - Captures screenshots on test failure
+    - Otherwise resets cookies, frames and the current page after each test
+    """
+    browser_config = config.get_browser_config(browser_name)
+    isolated = _open_isolated_tab(_driver_session, browser_config.window_size,
+                                  maximize=not _headless_requested(request, browser_config, browser_name))
+    
+    yield _driver_session
+    
+    # Take screenshot on test failure
+    if request.node.rep_call.failed if hasattr(request.node, 'rep_call') else False:
+        take_screenshot(_driver_session, request.node.name, config)
+    
+    if isolated:
+        try:
+            _close_isolated_tab(_driver_session, isolated)
+            return
+        except Exception as e:
+            logging.warning(f"Failed to dispose browser context: {e}")
+    
+    # Reset browser state for the next test; cookies are cleared before
+    # leaving the page because delete_all_cookies acts on the current domain
+    try:
+        _driver_session.delete_all_cookies()
+        _driver_session.switch_to.default_content()
+        _driver_session.get("about:blank")
+    except Exception as e:
+        logging.warning(f"Failed to reset WebDriver state: {e}")
 
 
 def take_screenshot(driver, test_name, config):
@@ -215,16 +525,41 @@ def take_screenshot(driver, test_name, config):
         screenshot_name = f"{test_name}_{timestamp}.png"
         screenshot_path = config.get_screenshots_dir() / screenshot_name
         
-        driver.save_screenshot(str(screenshot_path))
-        logging.info(f"Screenshot saved: {screenshot_path}")
+        # Grab the PNG now; the disk write happens off the teardown path
+        png = driver.get_screenshot_as_png()
+        if _screenshot_writer is not None:
+            _screenshot_queue.put((screenshot_path, png))
+        else:
+            screenshot_path.write_bytes(png)
+            logging.info(f"Screenshot saved: {screenshot_path}")
         
     except Exception as e:
         logging.error(f"Failed to take screenshot: {e}")
 
 
-@pytest.fixture(scope="function")
-def api_client(config, environment):
-    """API client fixture for API testing"""
+@pytest.fixture(scope="session")
+def http():
+    """Session-wide HTTP session with keep-alive connection pooling and retries"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    session = requests.Session()
+    # Retry transient connection resets and gateway errors; after the last
+    # attempt the final response is returned so tests can assert on it
+    retries = Retry(total=3, backoff_factor=0.1, status_forcelist=(502, 503, 504), raise_on_status=False)
+    adapter = HTTPAdapter(max_retries=retries, pool_connections=10, pool_maxsize=20)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({'Connection': 'keep-alive'})
+    
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def _api_client_session(config, environment):
+    """Session-scoped API client; its keep-alive connections are closed at session end"""
     import requests
     
     class APIClient:
@@ -256,7 +591,21 @@ def api_client(config, environment):
     env_config = config.get_environment_config(environment)
     api_base_url = getattr(env_config, 'api_base_url', env_config.base_url + '/api')
     
-    return APIClient(api_base_url, env_config.timeout)
+    client = APIClient(api_base_url, env_config.timeout)
+    yield client
+    client.session.close()
+
+
+@pytest.fixture(scope="function")
+def api_client(_api_client_session):
+    """
+    API client fixture for API testing.
+    
+    Reuses the session-wide client but starts every test with an empty
+    cookie jar, so a login in one test never leaks into the next.
+    """
+    _api_client_session.session.cookies.clear()
+    yield _api_client_session
 
 
 @pytest.fixture(scope="function")
@@ -276,9 +625,9 @@ def test_user_data():
     }
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def logger():
-    """Logger fixture for tests"""
+    """Logger fixture for tests, writing one log file per run (and xdist worker)"""
     # Create logger
     test_logger = logging.getLogger('test_automation')
     test_logger.setLevel(logging.INFO)
@@ -288,7 +637,8 @@ def logger():
     logs_dir.mkdir(parents=True, exist_ok=True)
     
     # Create file handler
-    log_file = logs_dir / f"test_execution_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    log_file = logs_dir / f"test_execution_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{worker}.log"
     file_handler = logging.FileHandler(log_file)
     file_handler.setLevel(logging.INFO)
     
@@ -299,10 +649,13 @@ def logger():
     file_handler.setFormatter(formatter)
     
     # Add handler to logger
-    if not test_logger.handlers:
-        test_logger.addHandler(file_handler)
+    test_logger.addHandler(file_handler)
+    
+    yield test_logger
     
-    return test_logger
+    # Close the log file at the end of the session
+    test_logger.removeHandler(file_handler)
+    file_handler.close()
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -1,21 +1,27 @@
 #!/usr/bin/env python3
+import os
 import socket
-from app import app
+from app import app, init_db
 
 def find_free_port():
-    """Find a free port starting from 5000"""
-    for port in range(5000, 5010):
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.bind(('localhost', port))
-            sock.close()
-            return port
-        except OSError:
-            continue
-    return 8080  # fallback
+    """Ask the kernel for a free ephemeral port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        # Allow immediate reuse so rapid restarts don't hit TIME_WAIT
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(('localhost', 0))
+        return sock.getsockname()[1]
 
 if __name__ == '__main__':
-    port = find_free_port()
+    init_db()
+    # PORT pins the port, e.g. when the test suite starts the server
+    port = int(os.getenv('PORT') or find_free_port())
     print(f"🚀 Starting Flask app on port {port}")
     print(f"🌐 Access at: http://localhost:{port}")
-    app.run(debug=True, host='0.0.0.0', port=port)
\ No newline at end of file
+    if os.getenv('FLASK_DEV'):
+        # Debugger only on request; never the reloader, which forks a second
+        # interpreter and stat-polls the source tree
+        debug = os.environ.get('FLASK_DEBUG') == '1'
+        app.run(debug=debug, use_reloader=False, threaded=True, host='0.0.0.0', port=port)
+    else:
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=port, threads=8)
\ No newline at end of file
@@ -1,17 +1,19 @@
 from app import app
+import os
 import socket
 
 def find_port():
-    for port in range(5000, 5020):
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.bind(('127.0.0.1', port))
-            sock.close()
-            return port
-        except:
-            continue
-    return 8080
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+if __name__ == '__main__':
+    port = find_port()
+    print(f"🚀 Starting on http://localhost:{port}")
+    if os.getenv('FLASK_DEV'):
+        app.run(host='127.0.0.1', port=port, debug=False, use_reloader=False, threaded=True)
+    else:
+        from waitress import serve
+        serve(app, host='127.0.0.1', port=port, threads=8)
 
-port = find_port()
-print(f"🚀 Starting on http://localhost:{port}")
-app.run(host='127.0.0.1', port=port, debug=False)
@@ -0,0 +1,87 @@
+"""
+Password hashing tests for the Flask application.
+
+These tests check the pure-Python PBKDF2 fallback against the OpenSSL
+implementation it stands in for, and the lazy PBKDF2 to Argon2id upgrade
+on login.
+"""
+
+import hashlib
+import sqlite3
+from collections import OrderedDict
+
+import pytest
+
+import app as app_module
+from app import _pbkdf2_sha256_fast
+
+
+class TestPBKDF2Fallback:
+    """Pure-Python PBKDF2-HMAC-SHA256 test suite"""
+
+    @pytest.mark.auth
+    @pytest.mark.parametrize("password", [
+        b"admin123",
+        b"",
+        b"k" * 64,
+        b"x" * 100,
+    ], ids=["short", "empty", "block-sized", "longer-than-block"])
+    @pytest.mark.parametrize("iterations", [1, 2, 1000])
+    def test_matches_hashlib(self, password, iterations):
+        """Test that the fallback matches hashlib.pbkdf2_hmac for any key length"""
+        salt = b"0123456789abcdef0123456789abcdef"
+
+        expected = hashlib.pbkdf2_hmac('sha256', password, salt, iterations)
+
+        assert _pbkdf2_sha256_fast(password, salt, iterations) == expected
+
+
+@pytest.fixture
+def app_client(tmp_path, monkeypatch):
+    """Flask test client backed by a throwaway database and empty verify cache"""
+    db_path = tmp_path / "test_app.db"
+    monkeypatch.setitem(app_module.app.config, "DATABASE", str(db_path))
+    monkeypatch.setattr(app_module, "_DB_POOL", None)
+    monkeypatch.setattr(app_module, "_VERIFY_CACHE", OrderedDict())
+    app_module.init_db()
+    yield app_module.app.test_client(), db_path
+
+
+def _stored_hash(db_path, username):
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT password_hash FROM users WHERE username = ?", (username,)).fetchone()[0]
+
+
+class TestPasswordMigration:
+    """Login verification and legacy hash upgrade test suite"""
+
+    @pytest.mark.auth
+    @pytest.mark.integration
+    def test_legacy_pbkdf2_login_upgrades_to_argon2(self, app_client):
+        """Test that a legacy PBKDF2 row logs in, is rehashed to Argon2id and still rejects bad passwords"""
+        if app_module.ARGON2_HASHER is None:
+            pytest.skip("argon2-cffi is not installed")
+        client, db_path = app_client
+
+        salt = "legacysalt"
+        digest = hashlib.pbkdf2_hmac('sha256', b"legacy123", salt.encode('utf-8'), 100000).hex()
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("INSERT INTO users (username, email, password_hash) VALUES (?, ?, ?)",
+                         ("legacy", "legacy@example.com", f"pbkdf2:sha256:100000${salt}${digest}"))
+
+        response = client.post("/login", data={"username": "legacy", "password": "legacy123"})
+        assert response.status_code == 302
+        assert response.headers["Location"].endswith("/dashboard")
+        assert _stored_hash(db_path, "legacy").startswith("$argon2id$"), "Legacy hash was not upgraded"
+
+        client.get("/logout")
+        response = client.post("/login", data={"username": "legacy", "password": "legacy123"})
+        assert response.status_code == 302, "Login with the upgraded hash failed"
+        assert response.headers["Location"].endswith("/dashboard")
+
+        # The correct password is now cached; a wrong one must still be rejected
+        client.get("/logout")
+        response = client.post("/login", data={"username": "legacy", "password": "wrong-password"})
+        assert response.status_code == 200
+        with client.session_transaction() as session:
+            assert "user_id" not in session, "Wrong password was accepted"